@@ -1,28 +1,60 @@
-"""
-	This file is part of dlpc350 - A python library to control a DLPC350 DLP Digital Controller
-    Copyright (C) 2016 Francesco Valla
+# This file is part of dlpc350 - A python library to control a DLPC350 DLP Digital Controller
+# Copyright (C) 2016 Francesco Valla
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-    This program is free software: you can redistribute it and/or modify
-    it under the terms of the GNU General Public License as published by
-    the Free Software Foundation, either version 3 of the License, or
-    (at your option) any later version.
+"""dlpc350 - Python control library for the TI DLPC350 DMD controller."""
 
-    This program is distributed in the hope that it will be useful,
-    but WITHOUT ANY WARRANTY; without even the implied warranty of
-    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
-    GNU General Public License for more details.
+__version__ = "0.1"
 
-    You should have received a copy of the GNU General Public License
-    along with this program.  If not, see <http://www.gnu.org/licenses/>.
-"""
+__all__ = ["DLPC350", "SettingsError", "packPatternData", "__version__"]
 
-import dlpc350
+# Public names, and the submodule each one is imported from on first access.
+_LAZY = {"DLPC350": "._core",
+         "SettingsError": "._core",
+         "packPatternData": "._core"}
+
+# Authorship metadata lives in setup.py and is read back from the installed
+# distribution on first access.
+_METADATA = {"__author__": "Author",
+             "__email__": "Author-email",
+             "__license__": "License",
+             "__maintainer__": "Maintainer",
+             "__copyright__": "Author"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value  # cache so __getattr__ isn't called again
+        return value
+    if name in _METADATA:
+        from importlib.metadata import metadata, PackageNotFoundError
+        try:
+            value = metadata("dlpc350")[_METADATA[name]]
+        except PackageNotFoundError:
+            value = None
+        if value is None:
+            raise AttributeError("module %r has no attribute %r"
+                                 % (__name__, name))
+        if name == "__copyright__":
+            value = "Copyright 2016, %s" % value
+        globals()[name] = value
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
-__version__ = "0.1"
-__author__ = "Francesco Valla"
-__copyright__ = "Copyright 2016, Francesco Valla"
-__license__ = "LGPL"
-__maintainer__ = "Francesco Valla"
-__email__ = "valla.francesco@gmail.com"
 
-DLPC350 = dlpc350.DLPC350
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
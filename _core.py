@@ -0,0 +1,1197 @@
+"""
+	This file is part of dlpc350 - A python library to control a DLPC350 DLP Digital Controller
+    Copyright (C) 2016 Francesco Valla
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import division
+
+import functools
+import queue
+import struct
+import threading
+import time
+import weakref
+
+
+class SettingsError(Exception):
+    def __init__(self, mismatch):
+        Exception.__init__(self, mismatch)
+
+
+# Indexes of the values in DLPC350.status
+IDX_HARDWARE = 0
+IDX_SYSTEM = 1
+IDX_MAIN = 2
+IDX_DISPLAYMODE = 3
+IDX_INPUTSOURCE = 4
+IDX_LEDRED = 5
+IDX_LEDGREEN = 6
+IDX_LEDBLUE = 7
+_STATUS_KEYS = ('hardware', 'system', 'main', 'displaymode',
+                'inputsource', 'ledRed', 'ledGreen', 'ledBlue')
+
+
+# Bounds, in seconds, of the exponential backoff between status polls
+_POLL_DELAY_MIN = 1e-4
+_POLL_DELAY_MAX = 5e-3
+
+# Time, in seconds, for which the status read by getFullStatus is reused when
+# no command has been written in the meantime
+_STATUS_TTL = 5e-4
+
+# Status bits decoded in debug mode: label, bit mask, text when the bit is set
+# and text when it is cleared
+_HARDWARE_BITS = (("Internal initialization:", 0x01, "OK", "Error"),
+                  ("DMD Reset Controller:", 0x04, "Error", "OK"),
+                  ("Forced Swap:", 0x08, "Error", "OK"),
+                  ("Sequencer Abort:", 0x40, "Error", "OK"),
+                  ("Sequencer:", 0x80, "Error", "OK"))
+_SYSTEM_BITS = (("Internal Memory Test:", 0x01, "Passed", "Failed"),)
+_MAIN_BITS = (("DMD Park Status:", 0x01, "Parked", "Not parked"),
+              ("Sequencer Run Flag:", 0x02, "Running", "Stopped"),
+              ("Frame Buffer Swap Flag:", 0x04, "Frozen", "Not frozen"),
+              ("Gamma Correction Func:", 0x40, "Enabled", "Disabled"))
+
+
+@functools.lru_cache(maxsize=None)
+def _statusText(title, bits, value):
+    """Decoded status section, formatted once per status byte value"""
+    lines = ["=== %s ===" % title]
+    lines += ["%-25s%s" % (label, setText if value & mask else clearText)
+              for label, mask, setText, clearText in bits]
+    return "\n".join(lines)
+
+
+def _printStatusBits(title, bits, value):
+    print(_statusText(title, bits, value))
+
+
+# Validation data error bits and their meaning
+_VALIDATION_ERRORS = (
+    (0x01, "Selected exposure or frame period settings are invalid"),
+    (0x02, "Selected pattern numbers in LUT are invalid"),
+    (0x04, "Continuous Trigger Out1 request or overlapping black sectors"),
+    (0x08, "Post vector was not inserted prior to external triggered vector"),
+    (0x10, "Frame period or exposure difference is less than 230usec"))
+
+
+# GPIO configuration byte, indexed by state | buffertype << 1 |
+# direction << 2 | disable << 3
+_GPIO_CFG_LUT = tuple((i & 0x01) << 3 | (i >> 1 & 0x01) << 4 |
+                      (i >> 2 & 0x01) << 5 | (i >> 3 & 0x01) << 7
+                      for i in range(16))
+
+# Report ID, flags, sequence number, packet length (LSB first) and the two
+# command bytes
+_HEADER = struct.Struct('<BBBHBB')
+
+# Size of an USB HID report, not counting the leading report ID
+_REPORT_SIZE = 64
+
+
+def _dataBytes(data):
+    """Converts command data to bytes element by element, as the compiled
+    packet builder does; only buffers of unsigned bytes (bytes, bytearray,
+    NumPy uint8 arrays...) are taken as they are. Like the compiled builder,
+    raises TypeError for non-integer elements (floats included) and
+    ValueError for values out of range(0, 256).
+    """
+    if isinstance(data, bytes):
+        return data
+    try:
+        mv = memoryview(data)
+    except TypeError:
+        return bytes(list(data))
+    if(mv.format == 'B'):
+        return mv.tobytes()
+    return bytes(list(data))
+
+
+def _pyBuildPacket(cmd2, cmd3, data, readonly, reply, sequenceNumber):
+    """Pure python version of the packet builder, see _dlpc350_fast.pyx"""
+    data = _dataBytes(data)
+    return _HEADER.pack(0x00, readonly << 7 | reply << 6, sequenceNumber,
+                        2 + len(data), cmd3, cmd2) + data
+
+
+try:
+    from ._dlpc350_fast import buildPacket as _buildPacket
+except ImportError:
+    _buildPacket = _pyBuildPacket
+
+
+@functools.lru_cache(maxsize=32)
+def _lutControlData(lutEntries, repeat, nrOfPattern, flashImages):
+    """Pattern Display LUT Control payload, which only depends on the shape
+    of the pattern sequence and is therefore cached across calls.
+    """
+    return bytes(((lutEntries - 1) & 0x7F, repeat & 0x01,
+                  (nrOfPattern - 1) & 0xFF, (flashImages - 1) & 0x3F))
+
+
+def packPatternData(patternNumber, bitDepth, led, trigger=0, invert=0,
+                    insertBlack=1, bufferSwap=0, trigOutPrev=0):
+    """Packs pattern definitions into Pattern Display LUT Data (three bytes
+    per entry, see the TI documentation of CMD2: 0x1A, CMD3: 0x34), ready to
+    be passed as sequence to DLPC350.sendPatternSequence.
+    Each argument is either a single value or a sequence with one value per
+    LUT entry; single values are used for all the entries. The packing is
+    done with NumPy, which is only required by this function.
+    """
+    import numpy as np
+    fields = np.broadcast_arrays(*[np.asarray(f, dtype=np.uint32) for f in
+                                   (trigger, patternNumber, bitDepth, led,
+                                    invert, insertBlack, bufferSwap,
+                                    trigOutPrev)])
+    trigger, patternNumber, bitDepth, led = fields[:4]
+    invert, insertBlack, bufferSwap, trigOutPrev = fields[4:]
+    entries = ((trigger & 0x03) | (patternNumber & 0x3F) << 2 |
+               (bitDepth & 0x0F) << 8 | (led & 0x0F) << 12 |
+               (invert & 0x01) << 16 | (insertBlack & 0x01) << 17 |
+               (bufferSwap & 0x01) << 18 | (trigOutPrev & 0x01) << 19)
+    return entries.reshape(-1).astype('<u4').view(np.uint8).reshape(
+        -1, 4)[:, :3].tobytes()
+
+
+def _staticPacket(cmd2, cmd3, *data):
+    """Builds a packet that carries no sequence number, which is therefore
+    the same on every call. Packets without data are read commands expecting
+    a reply, packets with data are write commands without reply.
+    """
+    readonly = reply = 0 if data else 1
+    return _buildPacket(cmd2, cmd3, data, readonly, reply, 0x00)
+
+
+def _txWriter(write, txQueue, errors):
+    """Background writer of DLPC350.sendPatternSequenceAsync: writes the
+    queued lists of reports until it gets None. Once a write has failed the
+    queued reports are dropped, and the error is kept in errors.
+    It holds no reference to the DLPC350 instance, which can be collected.
+    """
+    while True:
+        reports = txQueue.get()
+        try:
+            if reports is None:
+                return
+            if not errors:
+                for report in reports:
+                    write(report)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            txQueue.task_done()
+
+
+class DLPC350:
+    """Class meant to control the DPLC350 through USB HID connection"""
+
+    __slots__ = ('debug', 'dryrun', 'pipelined', 'seqN', 'connected', 'status',
+                 'dlp_hid', '_hid_read', 'DisplayMode', '_statusTime',
+                 '_txQueue', '_txPending', '_txErrors', '_txStop',
+                 '__weakref__')
+
+    # Prebuilt packets of the commands without arguments or sequence number
+    _STATIC_PKTS = {
+        'getHardwareStatus': _staticPacket(0x1A, 0x0A),
+        'getSystemStatus': _staticPacket(0x1A, 0x0B),
+        'getMainStatus': _staticPacket(0x1A, 0x0C),
+        'softwareReset': _staticPacket(0x08, 0x02, 0x00),
+        'enterStandby': _staticPacket(0x02, 0x00, 0x01),
+        'exitStandby': _staticPacket(0x02, 0x00, 0x00),
+        'getFlashStatus': _staticPacket(0x00, 0x00),
+        'forceBufferSwap': _staticPacket(0x1A, 0x26, 0x01),
+        'disableBufferSwapping': _staticPacket(0x10, 0x0A, 0x01),
+        'enableBufferSwapping': _staticPacket(0x10, 0x0A, 0x00),
+        'disableBufferWrite': _staticPacket(0x1A, 0x27, 0x01),
+        'enableBufferWrite': _staticPacket(0x1A, 0x27, 0x00),
+        'getCurrentBufferPointer': _staticPacket(0x1A, 0x28),
+        'getInputSource': _staticPacket(0x1A, 0x00),
+        'getDisplayMode': _staticPacket(0x1A, 0x1B),
+        'startValidation': _staticPacket(0x1A, 0x1A, 0x00),
+        'getValidationData': _staticPacket(0x1A, 0x1A),
+        'startPatternSequence': _staticPacket(0x1A, 0x24, 0x02),
+        'pausePatternSequence': _staticPacket(0x1A, 0x24, 0x01),
+        'stopPatternSequence': _staticPacket(0x1A, 0x24, 0x00),
+        'getLEDOutputEnable': _staticPacket(0x1A, 0x07),
+        'getLEDPWMPolarity': _staticPacket(0x1A, 0x05),
+        'getLEDCurrent': _staticPacket(0x0B, 0x01),
+    }
+
+    def __init__(self, debug=0, dryrun=0, pipelined=0):
+        self.debug = debug
+        self.dryrun = dryrun
+        # Set when the HID stack accepts several requests before their
+        # replies are read back
+        self.pipelined = pipelined
+        self.seqN = 0x01
+        self.connected = 0
+        self.DisplayMode = None
+        # Time at which the status was last read, None when it is stale
+        self._statusTime = None
+        # Reports waiting for the background writer of
+        # sendPatternSequenceAsync, created on first use
+        self._txQueue = None
+        # Reports collected while sendPatternSequenceAsync builds a sequence
+        self._txPending = None
+        # Errors of the background writer, and its stop function
+        self._txErrors = []
+        self._txStop = None
+
+        # Internal Status, indexed by the IDX_* constants
+        self.status = bytearray(len(_STATUS_KEYS))
+
+        # The HID backend is only imported here, so that importing this
+        # module (e.g. for isinstance checks) never loads hidapi.
+        if(dryrun == 0):
+            import hid
+            self.dlp_hid = hid.device()
+        else:
+            from . import fakehid
+            self.dlp_hid = fakehid.device()
+        # Bound once, used by all the commands
+        self._hid_read = self.dlp_hid.read
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        error = self._close()
+        # A failed background write must not hide the error of the with body
+        if error is not None and exc[0] is None:
+            raise error
+
+    @property
+    def status_dict(self):
+        """Internal status as a dictionary keyed by name"""
+        return dict(zip(_STATUS_KEYS, self.status))
+
+    def _bytes2intLSB_(self, b):
+        return struct.unpack_from('<I', bytes(b))[0]
+
+    def buildPacket(self, cmd2, cmd3, data=None, readonly=1, reply=1, seq=0):
+        # seq is 0 or 1: whether the packet takes the next sequence number
+        sequenceNumber = (self.seqN & 0xFF) if seq else 0x00
+        self.seqN += seq
+        if data is None:
+            # Header only, length is just the two command bytes
+            return _HEADER.pack(0x00, readonly << 7 | reply << 6,
+                                sequenceNumber, 2, cmd3, cmd2)
+        return _buildPacket(cmd2, cmd3, data, readonly, reply, sequenceNumber)
+
+    def _hid_write(self, report):
+        """Writes a single HID report; any write may change the status of the
+        controller, so the cached status is invalidated. Reports still queued
+        by sendPatternSequenceAsync are sent first, to keep the commands in
+        order; while it builds a sequence, the reports are only collected.
+        """
+        if(self._txPending is not None):
+            self._txPending.append(report)
+            return len(report)
+        if(self._txQueue is not None):
+            # Errors of the queued writes are left to flush() and close()
+            self._txQueue.join()
+        self._statusTime = None
+        return self.dlp_hid.write(report)
+
+    def _popTxError(self):
+        errors = self._txErrors
+        error = errors[0] if errors else None
+        del errors[:]
+        return error
+
+    def flush(self):
+        """Waits until all the reports queued by sendPatternSequenceAsync
+        have been written; an error raised by a write is raised here.
+        """
+        if(self._txQueue is not None):
+            self._txQueue.join()
+        error = self._popTxError()
+        if error is not None:
+            raise error
+
+    def _writeReports(self, pkt):
+        """Writes a packet that may be longer than a single HID report: the
+        first report carries the header and the start of the data, the
+        following ones (each with its own report ID) carry only the rest of
+        the data.
+        """
+        write = self._hid_write
+        if(len(pkt) <= _REPORT_SIZE + 1):
+            write(pkt)
+            return
+        mv = memoryview(pkt)
+        write(mv[:_REPORT_SIZE + 1])
+        for i in range(_REPORT_SIZE + 1, len(pkt), _REPORT_SIZE):
+            write(b'\x00' + mv[i:i + _REPORT_SIZE])
+
+    def dumpPacket(self, pkt, response, cmdString):
+        print('[USB HID] SENT: ' + pkt[1:].hex(' ') + ' ' + cmdString)
+        if response:
+            print('[USB HID] RESPONSE: ' + bytes(response).hex(' '))
+
+    def connectDLP(self):
+        try:
+            self.dlp_hid.open(vendor_id=0x0451, product_id=0x6401)
+            self.connected = 1
+            if(self.debug):
+                print("Manufacturer: %s" % self.dlp_hid.get_manufacturer_string())
+                print("Product: %s" % self.dlp_hid.get_product_string())
+                print("Serial No: %s" % self.dlp_hid.get_serial_number_string())
+            return 1
+
+        except IOError:
+            if(self.debug):
+                print("Open failed!")
+            return 0
+
+    def close(self):
+        """Closes the USB HID connection, if it is open. Reports still
+        queued by sendPatternSequenceAsync are written before, and an error
+        raised by one of those writes is raised here.
+        """
+        error = self._close()
+        if error is not None:
+            raise error
+        return 1
+
+    def _close(self):
+        """Stops the background writer and closes the connection; returns
+        the error of a failed background write, if any.
+        """
+        txQueue, self._txQueue = self._txQueue, None
+        if(txQueue is not None):
+            self._txStop()  # the writer stops after the queued reports
+            self._txStop = None
+            txQueue.join()
+        if(self.connected):
+            self.dlp_hid.close()
+            self.connected = 0
+        return self._popTxError()
+
+    def softwareReset(self):
+        """Software Reset (CMD2: 0x08, CMD3: 0x02)
+        This command issues a software reset to the DLPC350, regardless of
+        the argument sent.
+        """
+        pkt = self._STATIC_PKTS['softwareReset']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Software Reset)')
+        return 1
+
+    def enterStandby(self):
+        """Power Control (CMD2: 0x02, CMD3: 0x00)
+        This command places the DLPC350 in a low-power state and powers down
+        the DMD interface. Standby mode should only be enabled after all data
+        for the last frame to be displayed has been transferred to the DLPC350.
+        Standby mode must be disabled prior to sending any new data.
+        """
+        pkt = self._STATIC_PKTS['enterStandby']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(enter Standby Mode)')
+        return 1
+
+    def exitStandby(self):
+        """Power Control (CMD2: 0x02, CMD3: 0x00)
+        This command places the DLPC350 in the normal power state and powers
+        up the DMD interface.
+        """
+        pkt = self._STATIC_PKTS['exitStandby']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(exit Standby Mode)')
+        return 1
+
+    def getFlashStatus(self):
+        """Read Status (CMD2: 0x00, CMD3: 0x00)
+        This command returns the current DLPC350 flash status.
+        """
+        pkt = self._STATIC_PKTS['getFlashStatus']
+        self._hid_write(pkt)
+        d = self._hid_read(5)
+        self.DisplayMode = d[4]
+        if(self.debug):
+            self.dumpPacket(pkt, d, '(Get Flash Status)')
+        return d[4]
+
+    def forceBufferSwap(self):
+        """Force Buffer Swap (CMD2: 0x1A, CMD3: 0x26)
+        This command switches between the two internal memory buffers by
+        swapping the read and write pointers.
+        After a buffer swap, the 24 bit-plane buffer that was streaming data
+        to the DMD is now used for input, while the previous 24 bit-plane
+        input buffer, now streams data to the DMD. The buffer should be
+        frozen before executing this command.
+        """
+        pkt = self._STATIC_PKTS['forceBufferSwap']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Force Buffer Swap)')
+        return 1
+
+    def disableBufferSwapping(self):
+        """Display Buffer Freeze (CMD2: 0x10, CMD3: 0x0A)
+        This command disables swapping the memory buffers.
+        When reconfiguring the chipset through a series of commands that change
+        the input source or operating mode, TI recommends to issue this command
+        to prevent temporary artifacts from reaching the display.
+        When the display buffer is frozen, the last image streamed to the DMD
+        continues to be displayed.
+        """
+        pkt = self._STATIC_PKTS['disableBufferSwapping']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Disable Buffer Swapping)')
+        return 1
+
+    def enableBufferSwapping(self):
+        """Display Buffer Freeze (CMD2: 0x10, CMD3: 0x0A)
+        This command enables swapping the memory buffers.
+        """
+        pkt = self._STATIC_PKTS['enableBufferSwapping']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Enable Buffer Swapping)')
+        return 1
+
+    def disableBufferWrite(self):
+        """Buffer Write Disable (CMD2: 0x1A, CMD3: 0x27)
+        This command  prevents the overwriting of the contents of the 48
+        bit-planes OR two 24-bit frame buffers of the internal memory buffer.
+        """
+        pkt = self._STATIC_PKTS['disableBufferWrite']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Disable Buffer Write)')
+        return 1
+
+    def enableBufferWrite(self):
+        """Buffer Write Disable (CMD2: 0x1A, CMD3: 0x27)
+        This command  enables the overwriting of the contents of the 48
+        bit-planes OR two 24-bit frame buffers of the internal memory buffer.
+        """
+        pkt = self._STATIC_PKTS['enableBufferWrite']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Enable Buffer Write)')
+        return 1
+
+    def getInputSource(self, source=0):
+        """Input Source Selection (CMD2: 0x1A, CMD3: 0x00)
+        This command returns the current input source.
+        """
+        pkt = self._STATIC_PKTS['getInputSource']
+        self._hid_write(pkt)
+        d = self._hid_read(5)
+        self.status[IDX_INPUTSOURCE] = d[4] & 0x03
+        if(self.debug):
+            self.dumpPacket(pkt, d, '(Get Input Source)')
+        return d[4] & 0x03
+
+    def setInputSource(self, source=0):
+        """Input Source Selection (CMD2: 0x1A, CMD3: 0x00)
+        The Input Source Selection command selects the input source to be
+        displayed by the DLPC350:
+        (0) 30-bit parallel port
+        (1) Internal Test Pattern
+        (2) Flash memory
+        (3) FPD-link interface.
+        After executing this command, poll the system status using getStatus
+        commands.
+        """
+        pkt = self.buildPacket(0x1A, 0x00, data=[source & 0x03], readonly=0,
+                               reply=0)
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Set Input Source)')
+        return 1
+
+    def loadImage(self, index=0):
+        """Load Image (CMD2: 0x1A, CMD3: 0x39)
+        This command loads an image from flash memory and then performs a
+        buffer swap to display the loaded image on the DMD.
+        After executing this command, poll the system status using getStatus
+        commands.
+        """
+        pkt = self.buildPacket(0x1A, 0x39, data=[index & 0xFF], readonly=0,
+                               reply=0)
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Load Image)')
+        return 1
+
+    def getImageLoadTiming(self, startingIndex=0, imageNumber=1):
+        """Image Load Timing (CMD2: 0x1A, CMD3: 0x3A)
+        When this command is executed, the system will load the specified
+        image and collect the amount of time it took to load that image.
+        The busy status of the system will be high until the images have been
+        loaded and the timing information is collected.
+        This command cannot be executed while the system is already displaying
+        patterns from flash.
+        """
+        pkt = self.buildPacket(0x1A, 0x3A, data=[startingIndex, imageNumber],
+                               readonly=0, reply=1)
+        self._hid_write(pkt)
+        d = self._hid_read(8)
+        if(self.debug):
+            self.dumpPacket(pkt, d, '(Image Load Timing)')
+        return self._bytes2intLSB_(d[4:8]) // 18667
+
+    def getImageLoadTimingBatch(self, indexes):
+        """Image Load Timing (CMD2: 0x1A, CMD3: 0x3A)
+        Same as getImageLoadTiming, for a list of single images; returns the
+        list of their load times. When the pipelined flag is set all the
+        requests are written before any reply is read.
+        """
+        if(not self.pipelined):
+            return [self.getImageLoadTiming(i, 1) for i in indexes]
+        pkts = [self.buildPacket(0x1A, 0x3A, data=[i, 1], readonly=0,
+                                 reply=1) for i in indexes]
+        write = self._hid_write
+        read = self._hid_read
+        for pkt in pkts:
+            write(pkt)
+        d = [read(8) for pkt in pkts]
+        if(self.debug):
+            for pkt, r in zip(pkts, d):
+                self.dumpPacket(pkt, r, '(Image Load Timing)')
+        return [self._bytes2intLSB_(r[4:8]) // 18667 for r in d]
+
+    def setDisplayMode(self, mode=0):
+        """Display Mode Selection Command (CMD2: 0x1A, CMD3: 0x1B)
+        This command enables the DLPC350 internal image processing functions
+        for video mode (0) or bypasses them for pattern display mode (1).
+        After executing this command, poll the system status using getStatus
+        command.
+        """
+        pkt = self.buildPacket(0x1A, 0x1B, data=[mode & 0x01], readonly=0,
+                               reply=0)
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Display Mode Selection)')
+        return 1
+
+    def startValidation(self):
+        """Validate Data Command Response (CMD2: 0x1A, CMD3: 0x1A)
+        The Validate Data command checks the programmed pattern display
+        modes and indicates any invalid settings. This command needs to be
+        executed after all pattern display configurations have been completed.
+        NOTE: Data to be interpreted only when bit 7 goes from 1 to 0.
+        """
+        pkt = self._STATIC_PKTS['startValidation']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Start Validation)')
+        return 1
+
+    def setPatternTriggerMode(self, mode):
+        """Pattern Trigger Mode Selection (CMD2: 0x1A, CMD3: 0x23)
+        This command selects between one of the three Pattern Trigger Modes.
+        (0) Pattern Trigger Mode 0: VSYNC serves to trigger the pattern display
+        sequence
+        (1) Pattern Trigger Mode 1: Internally or externally (through TRIG_IN_1
+        and TRIG_IN_2) generated trigger
+        (2) Pattern Trigger Mode 2: TRIG_IN_1 alternates between two patterns,
+        while TRIG_IN_2 advances to the next pair of patterns
+        (3) Pattern Trigger Mode 3: Internally or externally generated trigger
+        for Variable Exposure display sequence.
+        (4) Pattern Trigger Mode 4: VSYNC triggered for Variable Exposure
+        display sequence
+        Before executing this command, stop the current pattern sequence.
+        """
+        if(mode > 4):
+            if(self.debug):
+                print('Invalid pattern trigger mode selected!')
+            return -1
+        pkt = self.buildPacket(0x1A, 0x23, data=[mode], readonly=0, reply=0,
+                               seq=1)
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Pattern Trigger Mode Selection)')
+        return 1
+
+    def setTriggerOut1Control(self, invert_polarity=False, rising_delay=0xBB,
+                              falling_delay=0xBB):
+        """Trigger Out1 Control (USB: CMD2: 0x1A, CMD3: 0x1D)
+        The Trigger Out1 Control command sets the polarity, rising edge
+        delay, and falling edge delay of the DLPC350's TRIG_OUT_1 signal.
+        The delays are compared to when the pattern is displayed on the DMD.
+        Before executing this command, stop the current pattern sequence.
+        After executing this command, send the Validation command once before
+        starting the pattern sequence.
+        """
+        if invert_polarity:
+            inv = 0x02
+        else:
+            inv = 0x00
+        pkt = self.buildPacket(0x1A, 0x1D, data=[inv, rising_delay,
+                                                 falling_delay],
+                               readonly=0, reply=0, seq=1)
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Pattern Trigger Mode Selection)')
+        return 1
+
+    def setPatternInputSource(self, source=0x00):
+        """Pattern Display Data Input Source (CMD2: 0x1A, CMD3: 0x22)
+        The Pattern Display Data Input Source command selects the source of
+        the data for pattern display: streaming through the 24-bit RGB/FPD-link
+        interface (0b00) or stored data in the flash image memory area from
+        external flash (0b11). Before executing this command, stop the current
+        pattern sequence. After executing this command, send the Validation
+        commands once before starting the pattern sequence.
+        """
+        if(source not in [0b00, 0b11]):
+            if(self.debug):
+                print('Invalid pattern input source selected!')
+            return -1
+        pkt = self.buildPacket(0x1A, 0x22, data=[source], readonly=0, reply=0,
+                               seq=1)
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Pattern Input Data Source Selection)')
+        return 1
+
+    def startPatternSequence(self):
+        """Pattern Display Start/Stop Pattern Sequence (CMD2: 0x1A, CMD3: 0x24)
+        Start Pattern Display Sequence.
+        """
+        pkt = self._STATIC_PKTS['startPatternSequence']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Start Pattern Sequence)')
+        return 1
+
+    def pausePatternSequence(self):
+        """Pattern Display Start/Stop Pattern Sequence (CMD2: 0x1A, CMD3: 0x24)
+        Pause Pattern Display Sequence. The next Start command will start
+        the pattern sequence by re-displaying the current pattern in the
+        sequence.
+        """
+        pkt = self._STATIC_PKTS['pausePatternSequence']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Pause Pattern Sequence)')
+        return 1
+
+    def stopPatternSequence(self):
+        """Pattern Display Start/Stop Pattern Sequence (CMD2: 0x1A, CMD3: 0x24)
+        Stop Pattern Display Sequence. The next Start command will restart
+        the pattern sequence from the beginning.
+        """
+        pkt = self._STATIC_PKTS['stopPatternSequence']
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Stop Pattern Sequence)')
+        return 1
+
+    def setPatternExposureTime(self, exposureTime=0x4010, longerFramePeriod=0):
+        """Pattern Exposure Time and Frame Period (CMD2: 0x1A, CMD3: 0x29)
+        The Pattern Exposure Time and Frame Period dictates the length of
+        time a pattern is exposed and the frame period, expressed in us.
+        Either the pattern exposure time must be equivalent to the frame period
+        or the former must be less than the latter by 230 us.
+        Before executing this command, stop the current pattern sequence.
+        After executing this command, send the Validation commands once before
+        starting the pattern sequence.
+        """
+        framePeriod = exposureTime + (230 if longerFramePeriod == 1 else 0)
+        data = struct.pack('<II', exposureTime & 0xFFFFFFFF,
+                           framePeriod & 0xFFFFFFFF)
+        pkt = self.buildPacket(0x1A, 0x29, data=data, readonly=0, reply=0,
+                               seq=1)
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Pattern Exposure Time and Frame Period)')
+        return 1
+
+    def LUTControl(self, lutEntries=1, repeat=0, nrOfPattern=1, flashImages=1):
+        """Pattern Display LUT Control (CMD2: 0x1A, CMD3: 0x31)
+        The Pattern Display LUT Control Command controls the execution of
+        patterns stored in the lookup table. Before executing this command,
+        stop the current pattern sequence. After executing this command,
+        send the Validation command once before starting the pattern sequence.
+        """
+        data = _lutControlData(lutEntries, repeat, nrOfPattern, flashImages)
+        pkt = self.buildPacket(0x1A, 0x31, data=data, readonly=0, reply=0,
+                               seq=1)
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Pattern Display LUT Control)')
+        return 1
+
+    def setLUTOffsetPointer(self, offset):
+        """Pattern Display LUT Offset Pointer (CMD2: 0x1A, CMD3: 0x32)
+        The Pattern Display LUT Offset Pointer defines the location of the
+        LUT entries in the DLPC350 memory.
+        """
+        pkt = self._lutOffsetPacket(offset)
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Set LUT Offset Pointer)')
+        return 1
+
+    def _lutOffsetPacket(self, offset):
+        return self.buildPacket(0x1A, 0x32, data=[(offset & 0xFF)],
+                                readonly=0, reply=0, seq=1)
+
+    def openMailbox(self, function):
+        """Pattern Display LUT Access Control (CMD2: 0x1A, CMD3: 0x33)
+        The LUT on the DLPC350 has a mailbox to send data to different
+        registers, and this command selects which register will receive the
+        data. To select the flash image indexes or define the patterns used in
+        the pattern sequence for the pattern display mode, first open the
+        mailbox for the appropriate function by writing the appropriate bit.
+
+        (1) Open the mailbox for image index configuration
+        (2) Open the mailbox for pattern definition
+        (3) Open the mailbox for variable exposure pattern definition
+
+        Before executing this command, stop the current pattern sequence.
+        After executing this command, send the Validation command once before
+        starting the pattern sequence.
+        """
+        if(function not in [1, 2, 3]):
+            print('Wrong mailbox function selected!')
+            return -1
+        pkt = self._mailboxPacket(function)
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Open Mailbox)')
+        return 1
+
+    def closeMailboxes(self):
+        """Pattern Display LUT Access Control (CMD2: 0x1A, CMD3: 0x33)
+        Disables (closes) the mailboxes.
+        """
+        pkt = self._mailboxPacket(0)
+        self._hid_write(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Close Mailboxes)')
+        return 1
+
+    def _mailboxPacket(self, function):
+        # Function 0 closes the mailboxes
+        return self.buildPacket(0x1A, 0x33, data=[(function & 0x03)],
+                                readonly=0, reply=0, seq=1)
+
+    def setFlashImageIndexes(self, indexes):
+        """Pattern Display LUT Data (CMD2: 0x1A, CMD3: 0x34)
+        If the mailbox was opened to define the flash image indexes, list the
+        index numbers in the mailbox. For example, if the desired image index
+        sequence is 0, 1, 2, 1, then write 0x0 0x1 0x2 0x1 to the mailbox.
+        """
+        pkt = self._lutDataPacket(indexes)
+        self._writeReports(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Set Flash Image Indexes)')
+        return 1
+
+    def _lutDataPacket(self, data):
+        return self.buildPacket(0x1A, 0x34, data=data, readonly=0, reply=0,
+                                seq=1)
+
+    def _mailboxTransaction(self, function, offset, payload, label):
+        """Opens the mailbox for the given function (1, 2 or 3), sets the
+        LUT offset pointer, writes the payload as Pattern Display LUT Data
+        and closes the mailbox. None of these commands has a reply, so all
+        the packets are built first and then written back-to-back.
+        """
+        pkts = (self._mailboxPacket(function), self._lutOffsetPacket(offset),
+                self._lutDataPacket(payload), self._mailboxPacket(0))
+        for pkt in pkts:
+            self._writeReports(pkt)
+        if(self.debug):
+            self.dumpPacket(pkts[0], [], '(Open Mailbox)')
+            self.dumpPacket(pkts[1], [], '(Set LUT Offset Pointer)')
+            self.dumpPacket(pkts[2], [], label)
+            self.dumpPacket(pkts[3], [], '(Close Mailboxes)')
+        return 1
+
+    def fillPatternData(self, data):
+        """Pattern Display LUT Data (CMD2: 0x1A, CMD3: 0x34)
+        If the mailbox was opened to define the individual patterns, write
+        three bytes of data per pattern to the mailbox.
+        NOTE: raw LUT data, no control performed on the input array.
+        """
+        pkt = self._lutDataPacket(data)
+        self._writeReports(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Fill Pattern Data)')
+        return 1
+
+    def fillPatternDataBulk(self, chunks):
+        """Pattern Display LUT Data (CMD2: 0x1A, CMD3: 0x34)
+        Same as fillPatternData, for a list of data chunks: all the packets
+        are built first and then written back-to-back.
+        NOTE: raw LUT data, no control performed on the input arrays.
+        """
+        pkts = [self._lutDataPacket(c) for c in chunks]
+        for pkt in pkts:
+            self._writeReports(pkt)
+        if(self.debug):
+            for pkt in pkts:
+                self.dumpPacket(pkt, [], '(Fill Pattern Data)')
+        return 1
+
+    def fillPatternDataNP(self, arr):
+        """Pattern Display LUT Data (CMD2: 0x1A, CMD3: 0x34)
+        Same as fillPatternData, for LUT data held in a NumPy uint8 array
+        (or any other buffer of unsigned bytes), sent as a single command
+        split over consecutive HID reports.
+        NOTE: raw LUT data, no control performed on the input array.
+        """
+        mv = memoryview(arr)
+        if(mv.format != 'B'):
+            raise SettingsError("Pattern data must be unsigned bytes!")
+        pkt = self._lutDataPacket(mv.tobytes())
+        self._writeReports(pkt)
+        if(self.debug):
+            self.dumpPacket(pkt, [], '(Fill Pattern Data)')
+        return 1
+
+    def getLEDCurrent(self):
+        """LED Driver Current Control (CMD2: 0x0B, CMD3: 0x01)
+        This command fetches the LED PWM currents as percentages;
+        each current is represented by an 8bit value, where 0 means 0%
+        and 255 means 100%.
+        """
+        pkt = self._STATIC_PKTS['getLEDCurrent']
+        self._hid_write(pkt)
+        d = self._hid_read(7)
+        self.status[IDX_LEDRED] = 255 - d[4]
+        self.status[IDX_LEDGREEN] = 255 - d[5]
+        self.status[IDX_LEDBLUE] = 255 - d[6]
+        if(self.debug):
+            self.dumpPacket(pkt, d, '(Get LED Currents)')
+            print("=== LED Currents ===")
+            print("RED: %d (%f%%)" % (255 - d[4], ((255 - d[4]) * 100 / 255)))
+            print("GREEN: %d (%f%%)" % (255 - d[5], (255 - d[5]) * 100 / 255))
+            print("BLUE: %d (%f%%)" % (255 - d[6], (255 - d[6]) * 100 / 255))
+        return d[4:6]
+
+    def checkLedCurrent(self, r, g, b, lcrafterChk=1):
+        """Check if the LED current settings are safe."""
+        # Any value outside 0..255 has bits set above the lowest byte
+        if((r | g | b) & ~0xFF):
+            print("Invalid current settings given, \
+                  values must be between 0 and 255")
+            return 0
+        # Total current in units of 0.1 mA
+        totalCurrent = 69 * r + 71 * g + 63 * b + 9611
+        if(lcrafterChk and totalCurrent > 42000):
+            print("Total LED current exceding 4.3A!")
+            return 0
+        if(self.debug):
+            print("Total LED current: %fA" % (totalCurrent / 10000))
+        return 1
+
+    def setLEDCurrent(self, r=151, g=120, b=125):
+        """LED Driver Current Control (CMD2: 0x0B, CMD3: 0x01)
+        This command controls the pulse duration of the specific LED PWM
+        output pin. The PWM value can be set from 0 to 100% in 256 steps.
+        If the LED PWM polarity is set to normal polarity, a setting of 0xFF
+        gives the maximum PWM current.
+        NOTE: The LED current is a function of the specific LED driver design;
+        for example, the DLP Lightcrafter 4500 computes the currents as follows:
+            - Red LED Current (A) = 0.0175 x (LED Current Value) + 0.4495
+            - Green LED Current (A) = 0.0181 x (LED Current Value) + 0.3587
+            - Blue LED Current (A) = 0.0160 x (LED Current Value) + 0.1529
+        """
+        if(self.checkLedCurrent(r, g, b) == 1):
+            currents = [255 - r, 255 - g, 255 - b]
+            pkt = self.buildPacket(0x0B, 0x01, data=currents,
+                                   readonly=0, reply=0)
+            self._hid_write(pkt)
+            if(self.debug):
+                    self.dumpPacket(pkt, [], '(Set LED Current)')
+        return 1
+
+    def configureGPIO(self, pin, state=0, buffertype=0, direction=1, disable=0):
+        """The GPIO Configuration command enables GPIO functionality on a
+        specific set of DLPC350 pins. The command sets their direction,
+        output buffer type, and output state.
+        Parameters:
+            * pin: pin number
+            * state: output state (0 = low, 1 = high)
+            * buffertype: output buffer type (0 = standard, 1 = open-drain)
+            * direction: pin direction (0 = input, 1 = output)
+            * disable: GPIO disable (0 = GPIO function, 1 = alternate function)
+        """
+        cfg = _GPIO_CFG_LUT[(state & 0x01) | (buffertype & 0x01) << 1
+                            | (direction & 0x01) << 2 | (disable & 0x01) << 3]
+        config = bytes((pin & 0xFF, cfg))
+        pkt = self.buildPacket(0x1A, 0x38, data=config, readonly=0, reply=0)
+        self._hid_write(pkt)
+        if(self.debug):
+                self.dumpPacket(pkt, [], '(Configure GPIO)')
+        return 1
+
+    def readGPIO(self, pin):
+        """The GPIO Configuration command enables GPIO functionality on a
+        specific set of DLPC350 pins. The command sets their direction,
+        output buffer type, and output state.
+        Parameters:
+            * pin: pin number
+        """
+        config = [pin & 0xFF]
+        pkt = self.buildPacket(0x1A, 0x38, data=config, readonly=1, reply=1)
+        self._hid_write(pkt)
+        d = self._hid_read(6)
+        if(self.debug):
+                self.dumpPacket(pkt, d, '(Read GPIO)')
+        return d[5]
+
+    # Higher-level commands #
+    def getFullStatus(self):
+        """Reads the hardware, system and main status and returns them.
+        When the pipelined flag is set the three requests are written
+        back-to-back and the replies read afterwards, instead of waiting for
+        each reply before sending the next request.
+        A status read less than _STATUS_TTL seconds ago, with no command
+        written since, is returned without querying the controller again.
+        """
+        if(self._statusTime is None or
+           time.monotonic() - self._statusTime >= _STATUS_TTL):
+            self._readFullStatus()
+            self._statusTime = time.monotonic()
+        return (self.status[IDX_HARDWARE], self.status[IDX_SYSTEM],
+                self.status[IDX_MAIN])
+
+    def _readFullStatus(self):
+        if(not self.pipelined):
+            self.getHardwareStatus()
+            self.getSystemStatus()
+            self.getMainStatus()
+            return
+        write = self._hid_write
+        read = self._hid_read
+        pkts = (self._STATIC_PKTS['getHardwareStatus'],
+                self._STATIC_PKTS['getSystemStatus'],
+                self._STATIC_PKTS['getMainStatus'])
+        for pkt in pkts:
+            write(pkt)
+        d = [read(5) for pkt in pkts]
+        self.status[IDX_HARDWARE] = d[0][4]
+        self.status[IDX_SYSTEM] = d[1][4]
+        self.status[IDX_MAIN] = d[2][4]
+        if(self.debug):
+            self.dumpPacket(pkts[0], d[0], '(Hardware Status)')
+            self.dumpPacket(pkts[1], d[1], '(System Status)')
+            self.dumpPacket(pkts[2], d[2], '(Main Status)')
+
+    def getStatus(self):
+        """Gets the status of the system. Returns 1 when the system is in a
+        "safe" status, 0 otherwise.
+        """
+        hardware, system, main = self.getFullStatus()
+
+        if(hardware == 0x01 and system == 0x01):
+            return 1
+
+        if(self.debug):
+            _printStatusBits("Hardware Status", _HARDWARE_BITS, hardware)
+            _printStatusBits("System Status", _SYSTEM_BITS, system)
+            _printStatusBits("Main Status", _MAIN_BITS, main)
+
+        return 0
+
+    def pollForStatusOK(self, timeout=1):
+        """Polls the status until the system is in a "safe" status, for at
+        most timeout seconds. Returns the last result of getStatus.
+        The changes looked for are not caused by writes, so every poll reads
+        the status from the controller instead of reusing a cached one.
+        """
+        deadline = time.monotonic() + timeout
+        delay = _POLL_DELAY_MIN
+        self._statusTime = None
+        status = self.getStatus()
+        while(not status and time.monotonic() < deadline):
+            time.sleep(delay)
+            delay = min(delay * 2, _POLL_DELAY_MAX)
+            self._statusTime = None
+            status = self.getStatus()
+        return status
+
+    def validateSequence(self, timeout=1, settle=0):
+        """Sends the validation command and polls for valid validation data,
+        starting settle seconds after the command.
+        Raises SettingsError if the validation is still busy after timeout
+        seconds.
+        """
+        if(self.debug):
+            print("Validating sequence..."),
+        self.startValidation()
+        deadline = time.monotonic() + timeout
+        if(settle):
+            time.sleep(settle)
+        delay = _POLL_DELAY_MIN
+        d = self.getValidationData()
+        while(d & 0x80):
+            if(time.monotonic() > deadline):
+                raise SettingsError("Sequence validation timed out!")
+            time.sleep(delay)
+            delay = min(delay * 2, _POLL_DELAY_MAX)
+            d = self.getValidationData()
+
+        if(self.debug and d == 0):
+            print("OK!")
+        elif(d):
+            print("Validation Error")
+
+        for mask, message in _VALIDATION_ERRORS:
+            if(d & mask):
+                print(message)
+
+        return d
+
+    def validateSequenceBlocking(self, timeout=1, settle=0.005):
+        """Same as validateSequence, but waits for the validation to be
+        normally complete (settle seconds) before reading the validation
+        data, so that in the common case it is read only once.
+        """
+        return self.validateSequence(timeout=timeout, settle=settle)
+
+    def sendPatternSequence(self, sequence=b'\x00\x21\x06',
+                            flashIndexes=b'\x08', displayTime=100000,
+                            triggerMode=1, repeat=0):
+        """Sends a pattern sequence.
+        Parameters:
+            * sequence: pattern sequence, three bytes per LUT entry.
+            * flashIndexes: indexes of flash images used in the sequence.
+            * displayTime: exposure time for each pattern.
+            * triggerMode: trigger mode (see TI documentation for details).
+            * repeat: repeat sequence.
+        Both sequence and flashIndexes can be bytes, bytearrays, NumPy uint8
+        arrays or sequences of integers; they are converted to bytes only
+        once.
+        """
+        try:
+            sequence = _dataBytes(sequence)
+            flashIndexes = _dataBytes(flashIndexes)
+        except (TypeError, ValueError):  # raised by both packet builders
+            raise SettingsError("Invalid pattern sequence!")
+        nrOfLUTEntries = len(sequence) // 3
+        nrOfFlashImages = len(flashIndexes)
+        if len(sequence) % 3 or not nrOfLUTEntries:
+            raise SettingsError("Invalid pattern sequence!")
+        if not nrOfFlashImages or nrOfFlashImages > nrOfLUTEntries:
+            raise SettingsError("Invalid number of Flash images!")
+
+        self.setPatternInputSource(source=3)  # Input source: flash
+        self.LUTControl(lutEntries=nrOfLUTEntries, repeat=repeat,
+                        nrOfPattern=nrOfLUTEntries, flashImages=nrOfFlashImages)
+        self.setPatternExposureTime(exposureTime=displayTime, longerFramePeriod=0)
+        self.setPatternTriggerMode(mode=triggerMode)
+        self._mailboxTransaction(2, 0, sequence, '(Fill Pattern Data)')
+        self._mailboxTransaction(1, 0, flashIndexes,
+                                 '(Set Flash Image Indexes)')
+
+    def sendPatternSequenceAsync(self, *args, **kwargs):
+        """Same as sendPatternSequence, but the reports are only built here
+        and then written by a background thread, so that the caller can go
+        on (e.g. computing the next sequence) while they are sent.
+        Any other command, and flush(), waits until they have all been
+        written. An error raised by one of the writes is raised by the next
+        flush() or close(); the reports queued after it are dropped.
+        """
+        if(self._txQueue is None):
+            self._txQueue = queue.Queue()
+            threading.Thread(target=_txWriter,
+                             args=(self.dlp_hid.write, self._txQueue,
+                                   self._txErrors),
+                             daemon=True).start()
+            # Also stops the writer if the instance is collected unclosed
+            self._txStop = weakref.finalize(self, self._txQueue.put, None)
+        self._txPending = []
+        try:
+            self.sendPatternSequence(*args, **kwargs)
+            reports = self._txPending
+        finally:
+            self._txPending = None
+        self._statusTime = None
+        self._txQueue.put(reports)
+
+
+def _makeGetter(name, mask, index, label, doc):
+    """Builds a method that sends the prebuilt read command of the given name
+    and returns the (masked) single byte of its answer, also storing it in
+    the internal status at the given index when that is not None.
+    """
+    pkt = DLPC350._STATIC_PKTS[name]
+
+    def getter(self):
+        self._hid_write(pkt)
+        d = self._hid_read(5)
+        if(self.debug):
+            self.dumpPacket(pkt, d, label)
+        value = d[4] & mask
+        if index is not None:
+            self.status[index] = value
+        return value
+    getter.__name__ = name
+    getter.__qualname__ = 'DLPC350.' + name
+    getter.__doc__ = doc
+    return getter
+
+
+# Single-byte read commands: name, answer mask, status index, debug label and
+# documentation of the generated DLPC350 methods.
+_GETTERS = (
+    ('getHardwareStatus', 0xFF, IDX_HARDWARE, '(Hardware Status)',
+     """Hardware Status (CMD2: 0x1A, CMD3: 0x0A)
+     The Hardware Status command provides status information on the
+     DLPC350's sequencer, DMD controller, and initialization.
+     """),
+    ('getSystemStatus', 0xFF, IDX_SYSTEM, '(System Status)',
+     """System Status (CMD2: 0x1A, CMD3: 0x0B)
+     The System Status command provides DLPC350 status on
+     internal memory tests.
+     """),
+    ('getMainStatus', 0xFF, IDX_MAIN, '(Main Status)',
+     """Main Status (CMD2: 0x1A, CMD3: 0x0C)
+     The Main Status command provides the status of DMD park and DLPC350
+     sequencer, frame buffer, and gamma correction.
+     """),
+    ('getCurrentBufferPointer', 0x01, None, '(Current Read Buffer Pointer)',
+     """Current Read Buffer Pointer (CMD2: 0x1A, CMD3: 0x28)
+     This command returns the pointer to the current internal memory
+     buffer whose data is streamed to the DMD.
+     """),
+    ('getDisplayMode', 0xFF, IDX_DISPLAYMODE, '(Get Display Mode)',
+     """Display Mode Selection Command (CMD2: 0x1A, CMD3: 0x1B)
+     This command returns the current DLPC350 display mode.
+     """),
+    ('getValidationData', 0xFF, None, '(Validate Data)',
+     """Validate Data Command Response (CMD2: 0x1A, CMD3: 0x1A)
+     The Validate Data command checks the programmed pattern display
+     modes and indicates any invalid settings. This command needs to be
+     executed after all pattern display configurations have been completed.
+     NOTE: Data to be interpreted only when bit 7 goes from 1 to 0.
+     """),
+    ('getLEDOutputEnable', 0xFF, None, '(Get LED Output Enable)',
+     """LED Enable Outputs (CMD2: 0x1A, CMD3: 0x07)
+     This command returns the status of the LED enable pins.
+     """),
+    ('getLEDPWMPolarity', 0xFF, None, '(Get LED Enable Output)',
+     """LED PWM Polarity (CMD2: 0x1A, CMD3: 0x05)
+     This command returns the status of the LED PWM polarities.
+     """),
+)
+
+for _getter in _GETTERS:
+    setattr(DLPC350, _getter[0], _makeGetter(*_getter))
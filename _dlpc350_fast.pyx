@@ -0,0 +1,61 @@
+# cython: language_level=3
+"""
+	This file is part of dlpc350 - A python library to control a DLPC350 DLP Digital Controller
+    Copyright (C) 2016 Francesco Valla
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from cpython.bytearray cimport PyByteArray_AS_STRING
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from cpython.number cimport PyNumber_Index
+from libc.string cimport memcpy
+
+
+cpdef bytes buildPacket(int cmd2, int cmd3, data, int readonly, int reply,
+                        int sequenceNumber):
+    """Builds a USB HID packet: report ID, flags, sequence number, length,
+    command bytes and data. Data elements are converted as bytes() does:
+    non-integers raise TypeError, values out of range(0, 256) ValueError.
+    """
+    cdef Py_ssize_t n = len(data)
+    cdef Py_ssize_t length = 2 + n
+    cdef Py_ssize_t i
+    cdef long value
+    # The bytes object is filled in place before anyone else can see it
+    cdef bytes out = PyBytes_FromStringAndSize(NULL, 7 + n)
+    cdef unsigned char *buf = <unsigned char *>PyBytes_AS_STRING(out)
+    buf[0] = 0x00
+    buf[1] = (readonly << 7) | (reply << 6)
+    buf[2] = sequenceNumber
+    buf[3] = length & 0xFF
+    buf[4] = (length >> 8) & 0xFF
+    buf[5] = cmd3
+    buf[6] = cmd2
+    if type(data) is bytes:
+        memcpy(buf + 7, PyBytes_AS_STRING(data), n)
+    elif type(data) is bytearray:
+        memcpy(buf + 7, PyByteArray_AS_STRING(data), n)
+    else:
+        try:
+            for i in range(n):
+                item = data[i]
+                if type(item) is not int:
+                    item = PyNumber_Index(item)
+                value = item
+                if value < 0 or value > 255:
+                    raise ValueError("bytes must be in range(0, 256)")
+                buf[7 + i] = <unsigned char>value
+        except OverflowError:
+            raise ValueError("bytes must be in range(0, 256)")
+    return out
@@ -16,26 +16,68 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import os
+import time
+
+
 class device:
-    """Testing HID fake class"""
+    """Testing HID fake class
+
+    Set FAKEHID_LATENCY_US in the environment to simulate the latency of
+    the USB link: writes are queued, and the next read (or close) waits for
+    a single round-trip, however many writes were queued before it. Reads
+    with no writes queued, whose replies have already arrived, return
+    immediately.
+    """
+
+    def __init__(self):
+        self._latency = float(os.environ.get("FAKEHID_LATENCY_US", "0")) / 1e6
+        self._pending = 0
+        # All-zero reply of a whole report; shorter reads return a (new) slice
+        # of it, whole-report reads the buffer itself
+        self._rxbuf = bytes(64)
+        # Device strings, only available while the device is open
+        self._mfg = self._prod = self._serial = None
+
+    def _flush(self):
+        if self._latency:
+            time.sleep(self._latency)
+        self._pending = 0
 
     def open(self, vendor_id=0, product_id=0, serial_number=None):
+        # Device strings are read once, when the device is opened
+        self._mfg, self._prod, self._serial = ("Francesco Valla",
+                                               "FakeHID Device", "0.1")
         return 1
 
     def write(self, buff):
+        self._pending += 1
         return 1
 
     def read(self, max_length, timeout_ms=0):
-        return [0] * max_length
+        if self._pending:
+            self._flush()
+        if max_length > len(self._rxbuf):
+            return bytes(max_length)
+        return self._rxbuf[:max_length]
 
     def close(self):
+        if self._pending:
+            self._flush()
+        self._mfg = self._prod = self._serial = None
         return 1
 
+    def _string(self, value):
+        # Same error as hidapi's device when it is not open
+        if value is None:
+            raise ValueError("not open")
+        return value
+
     def get_manufacturer_string(self):
-        return "Francesco Valla"
+        return self._string(self._mfg)
 
     def get_product_string(self):
-        return "FakeHID Device"
+        return self._string(self._prod)
 
     def get_serial_number_string(self):
-        return "0.1"
+        return self._string(self._serial)
@@ -0,0 +1,106 @@
+"""
+	This file is part of dlpc350 - A python library to control a DLPC350 DLP Digital Controller
+    Copyright (C) 2016 Francesco Valla
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import py_compile
+import re
+from importlib.util import cache_from_source
+
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+from setuptools.command.build_py import build_py
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+# The compiled packet builder is optional: without Cython (declared as a build
+# requirement in pyproject.toml) or without a C compiler the pure python
+# implementation in _core.py is used. Compiling the whole controller module
+# is opt-in, by setting DLPC350_ENABLE_SPEEDUPS=1 at build time.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    from Cython.Compiler.Errors import CompileError
+    ext_modules = cythonize([Extension("dlpc350._dlpc350_fast",
+                                       ["_dlpc350_fast.pyx"])],
+                            language_level=3)
+    if os.environ.get("DLPC350_ENABLE_SPEEDUPS") == "1":
+        try:
+            ext_modules += cythonize([Extension("dlpc350._core",
+                                                ["_core.py"])],
+                                     language_level=3)
+        except CompileError as e:
+            print("WARNING: dlpc350._core not compiled (%s)" % e)
+
+
+class optional_build_ext(build_ext):
+    """Builds the extensions that can be built and skips the others, whose
+    pure python modules are then used.
+    """
+
+    def run(self):
+        try:
+            build_ext.run(self)
+        except PlatformError as e:
+            print("WARNING: extensions not built (%s)" % e)
+
+    def build_extension(self, ext):
+        try:
+            build_ext.build_extension(self, ext)
+        except (CCompilerError, ExecError, PlatformError, OSError) as e:
+            print("WARNING: %s not built (%s)" % (ext.name, e))
+
+class optimized_build_py(build_py):
+    """Also ships the bytecode compiled with docstrings and asserts stripped,
+    used when the interpreter runs with -OO (see README). The pycs are
+    hash-based: pip does not preserve the mtime of the installed sources,
+    which would make timestamp-based pycs stale on the first import.
+    """
+
+    def run(self):
+        build_py.run(self)
+        for path in self.get_outputs(include_bytecode=0):
+            if path.endswith(".py"):
+                py_compile.compile(
+                    path, cfile=cache_from_source(path, optimization=2),
+                    optimize=2, doraise=True,
+                    invalidation_mode=py_compile.PycInvalidationMode.
+                    CHECKED_HASH)
+
+
+with open("__init__.py") as f:
+    version = re.search(r'^__version__ = "(.*)"', f.read(), re.M).group(1)
+
+setup(
+    name="dlpc350",
+    version=version,
+    description="A python library to control a DLPC350 DLP Digital "
+                "Controller through USB",
+    url="https://github.com/WallaceIT/dlpc350",
+    author="Francesco Valla",
+    author_email="valla.francesco@gmail.com",
+    maintainer="Francesco Valla",
+    maintainer_email="valla.francesco@gmail.com",
+    license="LGPL",
+    packages=["dlpc350"],
+    package_dir={"dlpc350": "."},
+    install_requires=["hidapi"],
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": optional_build_ext,
+              "build_py": optimized_build_py},
+)